@@ -8,8 +8,13 @@ Available cycles: 2015-2016, 2017-2020
 """
 
 import os
+import shutil
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import formatdate
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import urllib3
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -25,6 +30,15 @@ HEADERS = {
 
 BASE_URL = "https://wwwn.cdc.gov/Nchs/Data/Nhanes/Public"
 
+# Shared session so parallel downloads reuse keep-alive connections
+MAX_WORKERS = 8
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5),
+))
+
 # =============================================================================
 # FILE DEFINITIONS - 2015-2016 and 2017-2020
 # =============================================================================
@@ -87,27 +101,72 @@ MORTALITY_FILES = {
 
 
 def download_file(url: str, dest_path: Path, min_size: int = 1000) -> bool:
-    """Download a file with validation."""
+    """
+    Download a file with validation, streaming to a .part file first.
+    
+    If a valid local copy exists, the request is made conditional
+    (If-Modified-Since from its mtime, If-None-Match from the saved ETag)
+    and a 304 response skips the transfer.
+    """
+    tmp_path = dest_path.with_suffix(dest_path.suffix + ".part")
+    etag_path = dest_path.with_suffix(dest_path.suffix + ".etag")
+    have_local = dest_path.exists() and dest_path.stat().st_size > min_size
     try:
-        if dest_path.exists() and dest_path.stat().st_size > min_size:
-            print(f"  [EXISTS] {dest_path.name}")
-            return True
+        headers = dict(HEADERS)
+        if have_local:
+            headers['If-Modified-Since'] = formatdate(dest_path.stat().st_mtime, usegmt=True)
+            if etag_path.exists():
+                headers['If-None-Match'] = etag_path.read_text().strip()
+        else:
+            print(f"  [DOWNLOADING] {dest_path.name}...")
+        
+        with SESSION.get(url, headers=headers, verify=False, timeout=120, stream=True) as response:
+            if response.status_code == 304:
+                print(f"  [EXISTS] {dest_path.name} (not modified)")
+                return True
+            if response.status_code != 200:
+                if have_local:
+                    print(f"  [EXISTS] {dest_path.name} (check failed - Status {response.status_code})")
+                    return True
+                print(f"  [FAILED] {dest_path.name} - Status {response.status_code}")
+                return False
             
-        print(f"  [DOWNLOADING] {dest_path.name}...")
-        response = requests.get(url, headers=HEADERS, verify=False, timeout=120)
+            if have_local:
+                print(f"  [UPDATING] {dest_path.name}...")
+            response.raw.decode_content = True
+            with open(tmp_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=1 << 20)
+            etag = response.headers.get('ETag')
         
-        if response.status_code == 200 and len(response.content) > min_size:
-            with open(dest_path, 'wb') as f:
-                f.write(response.content)
-            print(f"  [SUCCESS] {dest_path.name} ({len(response.content):,} bytes)")
+        size = tmp_path.stat().st_size
+        if size > min_size:
+            os.replace(tmp_path, dest_path)
+            if etag:
+                etag_path.write_text(etag)
+            else:
+                etag_path.unlink(missing_ok=True)
+            print(f"  [SUCCESS] {dest_path.name} ({size:,} bytes)")
             return True
         else:
-            print(f"  [FAILED] {dest_path.name} - Status {response.status_code}")
-            return False
+            tmp_path.unlink(missing_ok=True)
+            print(f"  [FAILED] {dest_path.name} - Only {size:,} bytes")
+            return have_local
             
     except Exception as e:
+        tmp_path.unlink(missing_ok=True)
         print(f"  [ERROR] {dest_path.name}: {e}")
-        return False
+        return have_local
+
+
+def download_many(jobs: list, min_size: int = 1000) -> int:
+    """Download (url, dest_path) pairs concurrently; return number of successes."""
+    success = 0
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = [pool.submit(download_file, url, dest, min_size) for url, dest in jobs]
+        for future in as_completed(futures):
+            if future.result():
+                success += 1
+    return success
 
 
 def download_cycle(cycle_name: str, files: dict):
@@ -119,10 +178,8 @@ def download_cycle(cycle_name: str, files: dict):
     cycle_dir = DATA_RAW / cycle_name
     cycle_dir.mkdir(parents=True, exist_ok=True)
     
-    success = 0
-    for filename, url in files.items():
-        if download_file(url, cycle_dir / filename):
-            success += 1
+    jobs = [(url, cycle_dir / filename) for filename, url in files.items()]
+    success = download_many(jobs)
     
     print(f"\n  Downloaded {success}/{len(files)} files")
 
@@ -135,9 +192,10 @@ def download_mortality():
     
     DATA_MORTALITY.mkdir(parents=True, exist_ok=True)
     
-    for cycle, url in MORTALITY_FILES.items():
-        filename = url.split('/')[-1]
-        download_file(url, DATA_MORTALITY / filename, min_size=100)
+    jobs = [(url, DATA_MORTALITY / url.split('/')[-1]) for url in MORTALITY_FILES.values()]
+    success = download_many(jobs, min_size=100)
+    
+    print(f"\n  Downloaded {success}/{len(jobs)} files")
 
 
 def main():
@@ -9,33 +9,123 @@ Where:
 - z_ALM: z-score of appendicular lean mass, height-adjusted, sex-specific
 
 Higher IRI = better inflammatory resilience
+
+Usage: python 02_build_cohort.py [--csv]   (--csv also writes iri_cohort.csv)
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
+import pyreadstat
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import warnings
 
-warnings.filterwarnings('ignore')
-
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_RAW = PROJECT_ROOT / "data" / "raw"
 DATA_PROCESSED = PROJECT_ROOT / "data" / "processed"
 
+# 2017-2020 (pre-pandemic) names mapped onto the 2015-2016 names so every
+# cycle shares one schema before concatenation. Survey weights are left
+# alone: WTMECPRP/WTINTPRP cover 3.2 years and are not 2-year weights
+CANONICAL_COLUMNS = {
+    'BPXOSY1': 'BPXSY1', 'BPXOSY2': 'BPXSY2', 'BPXOSY3': 'BPXSY3',
+    'BPXODI1': 'BPXDI1', 'BPXODI2': 'BPXDI2', 'BPXODI3': 'BPXDI3',
+}
+
+# Columns kept from each component file (SEQN is always kept); everything
+# else in the wide NHANES files is dropped before joining
+BP_COLS = [
+    'BPXSY1', 'BPXSY2', 'BPXSY3', 'BPXSY4', 'BPXDI1', 'BPXDI2', 'BPXDI3', 'BPXDI4',
+    'BPXOSY1', 'BPXOSY2', 'BPXOSY3', 'BPXODI1', 'BPXODI2', 'BPXODI3',
+]
+KEEP_COLS = {
+    "HSCRP": ['LBXHSCRP'],
+    "BIOPRO": ['LBXSAL', 'LBXSCR'],
+    "DXX": ['DXDLALE', 'DXDRALE', 'DXDLLLE', 'DXDRLLE'],
+    "BMX": ['BMXBMI', 'BMXHT'],
+    "BPX": BP_COLS,
+    "BPXO": BP_COLS,
+    "BPQ": ['BPQ040A'],
+    "DIQ": ['DIQ010'],
+    "GHB": ['LBXGH'],
+    "GLU": ['LBXGLU'],
+    "TCHOL": ['LBXTC'],
+    "HDL": ['LBDHDD'],
+    "TRIGLY": ['LBXTR'],
+    "SMQ": ['SMQ020', 'SMQ040'],
+    "MCQ": ['MCQ160B', 'MCQ160C', 'MCQ160D', 'MCQ160E', 'MCQ160F', 'MCQ220'],
+    "HUQ": ['HUQ010'],
+    "PFQ": ['PFQ049', 'PFQ054'],
+    "DPQ": ['DPQ010', 'DPQ020', 'DPQ030', 'DPQ040', 'DPQ050',
+            'DPQ060', 'DPQ070', 'DPQ080', 'DPQ090'],
+}
+
+
+def write_cache(df: pd.DataFrame, cache_path: Path) -> None:
+    """
+    Write a Parquet cache atomically: write a temp file, then rename it into
+    place, so an interrupted run never leaves a truncated cache that looks
+    newer than its XPT. Failures only cost the cache, never the parsed data.
+    """
+    tmp_path = cache_path.with_suffix(cache_path.suffix + '.tmp')
+    try:
+        df.to_parquet(tmp_path, compression='zstd')
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"  Warning: Could not cache {cache_path.name}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
 
 def load_xpt(filepath: Path) -> pd.DataFrame:
-    """Load XPT file."""
+    """Load XPT file, using a Parquet sidecar cache when it is up to date."""
+    cache_path = filepath.with_suffix('.parquet')
+    try:
+        cache_fresh = cache_path.stat().st_mtime >= filepath.stat().st_mtime
+    except OSError:
+        cache_fresh = False
+    if cache_fresh:
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            # An unreadable cache is discarded and the XPT parsed afresh
+            print(f"  Warning: Could not read cache {cache_path.name}: {e}")
+            cache_path.unlink(missing_ok=True)
     try:
-        return pd.read_sas(filepath, format='xport', encoding='latin1')
+        df, _meta = pyreadstat.read_xport(str(filepath), encoding='latin1',
+                                          disable_datetime_conversion=True)
     except Exception as e:
         print(f"  Warning: Could not load {filepath.name}: {e}")
         return pd.DataFrame()
+    write_cache(df, cache_path)
+    return df
+
+
+def col_or_default(df: pd.DataFrame, name: str, default=np.nan) -> pd.Series:
+    """Return column `name`, or a constant Series on df.index if it is absent."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index, dtype=float)
 
 
-def find_file(cycle_dir: Path, pattern: str) -> Path:
-    """Find file matching pattern."""
-    matches = list(cycle_dir.glob(f"*{pattern}*"))
-    return matches[0] if matches else None
+def load_component(filepath: Path, keep_cols: list) -> pd.DataFrame:
+    """Load a component XPT file, keeping only SEQN and `keep_cols`."""
+    df = load_xpt(filepath)
+    return df[[c for c in ['SEQN', *keep_cols] if c in df.columns]]
+
+
+def scan_xpt_files(cycle_dir: Path) -> dict:
+    """Scan a cycle directory once; map upper-cased XPT filenames to paths."""
+    with os.scandir(cycle_dir) as entries:
+        return {e.name.upper(): Path(e.path) for e in entries
+                if e.is_file() and e.name.upper().endswith('.XPT')}
+
+
+def find_file(xpt_files: dict, pattern: str) -> Path:
+    """Find XPT file whose name contains pattern (Parquet sidecars are never listed)."""
+    pattern = pattern.upper()
+    return next((path for name, path in xpt_files.items() if pattern in name), None)
 
 
 def calculate_egfr_ckdepi2021(scr: pd.Series, age: pd.Series, sex: pd.Series) -> pd.Series:
@@ -45,16 +135,20 @@ def calculate_egfr_ckdepi2021(scr: pd.Series, age: pd.Series, sex: pd.Series) ->
     age: age in years
     sex: 1=Male, 2=Female
     """
-    kappa = np.where(sex == 2, 0.7, 0.9)
-    alpha = np.where(sex == 2, -0.241, -0.302)
-    female_mult = np.where(sex == 2, 1.012, 1.0)
-    
-    scr_kappa = scr / kappa
-    term1 = 142 * (np.minimum(scr_kappa, 1) ** alpha)
-    term2 = np.maximum(scr_kappa, 1) ** (-1.200)
-    term3 = 0.9938 ** age
-    
-    return term1 * term2 * term3 * female_mult
+    index = scr.index
+    scr = scr.to_numpy(dtype=float)
+    age = age.to_numpy(dtype=float)
+    female = sex.to_numpy() == 2
+    
+    # Work on raw arrays (no index alignment); kappa/alpha/multiplier chosen by sex
+    scr_kappa = scr / np.where(female, 0.7, 0.9)
+    egfr = (142.0
+            * np.minimum(scr_kappa, 1.0) ** np.where(female, -0.241, -0.302)
+            * np.maximum(scr_kappa, 1.0) ** -1.200
+            * 0.9938 ** age)
+    egfr *= np.where(female, 1.012, 1.0)
+    
+    return pd.Series(egfr, index=index)
 
 
 def process_cycle(cycle: str, cycle_dir: Path) -> pd.DataFrame:
@@ -67,8 +161,10 @@ def process_cycle(cycle: str, cycle_dir: Path) -> pd.DataFrame:
         print(f"  Directory not found")
         return pd.DataFrame()
     
+    xpt_files = scan_xpt_files(cycle_dir)
+    
     # Load demographics
-    demo_file = find_file(cycle_dir, "DEMO")
+    demo_file = find_file(xpt_files, "DEMO")
     if not demo_file:
         return pd.DataFrame()
     
@@ -98,14 +194,34 @@ def process_cycle(cycle: str, cycle_dir: Path) -> pd.DataFrame:
         ("DPQ", "Depression (PHQ-9)"),
     ]
     
-    for pattern, desc in components:
-        file_path = find_file(cycle_dir, pattern)
-        if file_path:
-            comp_df = load_xpt(file_path)
-            if 'SEQN' in comp_df.columns and len(comp_df) > 0:
-                df = df.merge(comp_df, on='SEQN', how='left', suffixes=('', f'_{pattern}'))
-                print(f"  Merged {desc}: {len(comp_df):,}")
-    
+    # Parse component files in parallel; join on the main process
+    found = [(pattern, desc, find_file(xpt_files, pattern)) for pattern, desc in components]
+    found = [(pattern, desc, path) for pattern, desc, path in found if path]
+    with ProcessPoolExecutor() as executor:
+        comp_dfs = list(executor.map(load_component,
+                                     [path for _, _, path in found],
+                                     [KEEP_COLS[pattern] for pattern, _, _ in found]))
+    
+    # Index every component on SEQN and join them all at once, renaming
+    # colliding columns up front the way merge(suffixes=('', '_PATTERN')) would.
+    # DEMO defines the participant universe, so other SEQNs are dropped first.
+    demo_seqns = pd.Index(df['SEQN'].unique())
+    seen = set(df.columns)
+    parts = []
+    for (pattern, desc, _), comp_df in zip(found, comp_dfs):
+        if 'SEQN' in comp_df.columns and len(comp_df) > 0:
+            n_records = len(comp_df)
+            comp_df = comp_df[comp_df['SEQN'].isin(demo_seqns)]
+            comp_df = comp_df.drop_duplicates('SEQN').set_index('SEQN')
+            comp_df = comp_df.rename(columns={c: f'{c}_{pattern}' for c in comp_df.columns if c in seen})
+            seen.update(comp_df.columns)
+            parts.append(comp_df)
+            print(f"  Merged {desc}: {n_records:,}")
+    
+    if parts:
+        df = df.set_index('SEQN').join(parts, how='left').reset_index()
+    
+    df = df.rename(columns={k: v for k, v in CANONICAL_COLUMNS.items() if v not in df.columns})
     df['cycle'] = cycle
     return df
 
@@ -128,9 +244,8 @@ def calculate_alm(df: pd.DataFrame) -> pd.Series:
     
     if len(available) == 4:
         # Sum in grams, convert to kg
-        alm_g = df[available].sum(axis=1)
-        alm_kg = alm_g / 1000
-        return alm_kg
+        alm_g = np.nansum(df[available].to_numpy(dtype=np.float32), axis=1)
+        return pd.Series(alm_g / 1000, index=df.index)
     else:
         print(f"  Warning: Missing ALM columns. Have: {available}")
         return pd.Series([np.nan] * len(df), index=df.index)
@@ -146,10 +261,10 @@ def build_iri_cohort(df: pd.DataFrame) -> pd.DataFrame:
     df['age'] = df['RIDAGEYR']
     df['sex'] = df['RIAGENDR']  # 1=Male, 2=Female
     df['female'] = (df['sex'] == 2).astype(int)
-    df['race_eth'] = df.get('RIDRETH3', pd.Series([np.nan] * len(df), index=df.index))
+    df['race_eth'] = col_or_default(df, 'RIDRETH3')
     
     # Survey design
-    df['mec_weight'] = df.get('WTMEC2YR', df.get('WTMECPRP', pd.Series([np.nan] * len(df), index=df.index)))
+    df['mec_weight'] = col_or_default(df, 'WTMEC2YR') if 'WTMEC2YR' in df.columns else col_or_default(df, 'WTMECPRP')
     df['psu'] = df['SDMVPSU']
     df['strata'] = df['SDMVSTRA']
     
@@ -158,11 +273,11 @@ def build_iri_cohort(df: pd.DataFrame) -> pd.DataFrame:
     # ==========================================================================
     
     # 1. hs-CRP (mg/L)
-    df['hscrp'] = df.get('LBXHSCRP', pd.Series([np.nan] * len(df), index=df.index))
+    df['hscrp'] = col_or_default(df, 'LBXHSCRP')
     print(f"  hs-CRP available: {df['hscrp'].notna().sum():,}")
     
     # 2. Serum Albumin (g/dL)
-    df['albumin'] = df.get('LBXSAL', pd.Series([np.nan] * len(df), index=df.index))
+    df['albumin'] = col_or_default(df, 'LBXSAL')
     print(f"  Albumin available: {df['albumin'].notna().sum():,}")
     
     # 3. Appendicular Lean Mass
@@ -170,7 +285,7 @@ def build_iri_cohort(df: pd.DataFrame) -> pd.DataFrame:
     print(f"  ALM available: {df['alm_kg'].notna().sum():,}")
     
     # Height for ALM adjustment
-    df['height_m'] = df.get('BMXHT', pd.Series([np.nan] * len(df), index=df.index)) / 100
+    df['height_m'] = col_or_default(df, 'BMXHT') / 100
     
     # ALM index (ALM / height^2) - similar to SMI (skeletal muscle index)
     # Treat ALM=0 as missing (DEXA not performed, not true zero)
@@ -183,86 +298,88 @@ def build_iri_cohort(df: pd.DataFrame) -> pd.DataFrame:
     
     print("\n  Calculating z-scores...")
     
-    # z_log_CRP (inverted: multiply by -1 so higher = less inflammation)
-    df['log_hscrp'] = np.log(df['hscrp'].replace(0, np.nan))
-    mean_log_crp = df['log_hscrp'].mean()
-    std_log_crp = df['log_hscrp'].std()
-    df['z_crp'] = (df['log_hscrp'] - mean_log_crp) / std_log_crp
-    df['z_crp_inv'] = df['z_crp'] * -1  # Inverted
+    # z-scores are computed on raw arrays so only the exported columns are
+    # materialized (std uses ddof=1 to match pandas)
+    log_crp = np.log(np.where(df['hscrp'] > 0, df['hscrp'], np.nan))
+    albumin = df['albumin'].to_numpy(dtype=float)
+    
+    # z_log_CRP (inverted so higher = less inflammation)
+    z_crp_inv = (np.nanmean(log_crp) - log_crp) / np.nanstd(log_crp, ddof=1)
     
     # z_Albumin
-    mean_alb = df['albumin'].mean()
-    std_alb = df['albumin'].std()
-    df['z_albumin'] = (df['albumin'] - mean_alb) / std_alb
-    
-    # z_ALMI (sex-specific)
-    df['z_almi'] = np.nan
-    for sex_val in [1, 2]:
-        mask = df['sex'] == sex_val
-        subset = df.loc[mask, 'almi']
-        mean_almi = subset.mean()
-        std_almi = subset.std()
-        if std_almi > 0:
-            df.loc[mask, 'z_almi'] = (subset - mean_almi) / std_almi
+    z_albumin = (albumin - np.nanmean(albumin)) / np.nanstd(albumin, ddof=1)
+    
+    # z_ALMI (sex-specific): per-sex mean/std broadcast back onto rows
+    almi_stats = df.groupby('sex')['almi'].agg(['mean', 'std'])
+    almi_std = almi_stats['std'].where(almi_stats['std'] > 0)
+    z_almi = ((df['almi'] - df['sex'].map(almi_stats['mean'])) / df['sex'].map(almi_std)).to_numpy(dtype=float)
     
     # ==========================================================================
     # MODIFIED IRI CONSTRUCTION
     # ==========================================================================
     
-    df['iri'] = df['z_crp_inv'] + df['z_albumin'] + df['z_almi']
+    df['z_crp_inv'] = z_crp_inv
+    df['z_albumin'] = z_albumin
+    df['z_almi'] = z_almi
+    df['iri'] = z_crp_inv + z_albumin + z_almi
     print(f"  IRI calculated for: {df['iri'].notna().sum():,}")
     
-    # IRI quartiles
-    df['iri_quartile'] = pd.qcut(df['iri'], q=4, labels=['Q1', 'Q2', 'Q3', 'Q4'])
+    # IRI quartiles as Int8 codes: 1=Q1 (lowest) ... 4=Q4 (highest), <NA> if no IRI
+    df['iri_quartile'] = (pd.qcut(df['iri'], q=4, labels=False) + 1).astype('Int8')
     
     # ==========================================================================
     # COVARIATES
     # ==========================================================================
     
     # BMI
-    df['bmi'] = df.get('BMXBMI', pd.Series([np.nan] * len(df), index=df.index))
+    df['bmi'] = col_or_default(df, 'BMXBMI')
     df['obesity'] = (df['bmi'] >= 30).astype(int)
     
     # Blood pressure
     sbp_cols = [c for c in df.columns if 'BPXSY' in c or 'BPXOSY' in c]
     dbp_cols = [c for c in df.columns if 'BPXDI' in c or 'BPXODI' in c]
-    df['mean_sbp'] = df[sbp_cols].mean(axis=1) if sbp_cols else np.nan
-    df['mean_dbp'] = df[dbp_cols].mean(axis=1) if dbp_cols else np.nan
+    with warnings.catch_warnings():
+        # Participants with no BP readings legitimately get NaN
+        warnings.filterwarnings('ignore', 'Mean of empty slice', RuntimeWarning)
+        df['mean_sbp'] = np.nanmean(df[sbp_cols].to_numpy(dtype=np.float32), axis=1) if sbp_cols else np.nan
+        df['mean_dbp'] = np.nanmean(df[dbp_cols].to_numpy(dtype=np.float32), axis=1) if dbp_cols else np.nan
     
-    bp_med = df.get('BPQ040A', pd.Series([np.nan] * len(df), index=df.index))
+    bp_med = col_or_default(df, 'BPQ040A')
     df['hypertension'] = ((df['mean_sbp'] >= 130) | (df['mean_dbp'] >= 80) | (bp_med == 1)).astype(float)
     
     # Diabetes
-    hba1c = df.get('LBXGH', pd.Series([np.nan] * len(df), index=df.index))
-    glucose = df.get('LBXGLU', pd.Series([np.nan] * len(df), index=df.index))
-    dm_told = df.get('DIQ010', pd.Series([np.nan] * len(df), index=df.index))
+    hba1c = col_or_default(df, 'LBXGH')
+    glucose = col_or_default(df, 'LBXGLU')
+    dm_told = col_or_default(df, 'DIQ010')
     df['hba1c'] = hba1c
     df['diabetes'] = ((hba1c >= 6.5) | (glucose >= 126) | (dm_told == 1)).astype(float)
     
     # Smoking
-    smoke_100 = df.get('SMQ020', pd.Series([np.nan] * len(df), index=df.index))
-    smoke_now = df.get('SMQ040', pd.Series([np.nan] * len(df), index=df.index))
-    df['smoking_status'] = np.nan
-    df.loc[smoke_100 == 2, 'smoking_status'] = 0  # Never
-    df.loc[(smoke_100 == 1) & smoke_now.isin([1, 2]), 'smoking_status'] = 2  # Current
-    df.loc[(smoke_100 == 1) & (smoke_now == 3), 'smoking_status'] = 1  # Former
+    smoke_100 = col_or_default(df, 'SMQ020')
+    smoke_now = col_or_default(df, 'SMQ040')
+    df['smoking_status'] = np.select(
+        [
+            smoke_100 == 2,                              # Never
+            (smoke_100 == 1) & smoke_now.isin([1, 2]),   # Current
+            (smoke_100 == 1) & (smoke_now == 3),         # Former
+        ],
+        [0, 2, 1],
+        default=np.nan,
+    )
     df['current_smoker'] = (df['smoking_status'] == 2).astype(int)
     
     # eGFR
-    scr = df.get('LBXSCR', pd.Series([np.nan] * len(df), index=df.index))
+    scr = col_or_default(df, 'LBXSCR')
     df['egfr'] = calculate_egfr_ckdepi2021(scr, df['age'], df['sex'])
     df['ckd'] = (df['egfr'] < 60).astype(int)
     
     # CVD history
-    chd = df.get('MCQ160C', pd.Series([2] * len(df), index=df.index))
-    mi = df.get('MCQ160E', pd.Series([2] * len(df), index=df.index))
-    stroke = df.get('MCQ160F', pd.Series([2] * len(df), index=df.index))
-    angina = df.get('MCQ160D', pd.Series([2] * len(df), index=df.index))
-    chf = df.get('MCQ160B', pd.Series([2] * len(df), index=df.index))
-    df['cvd_history'] = ((chd == 1) | (mi == 1) | (stroke == 1) | (angina == 1) | (chf == 1)).astype(float)
+    # CHF, CHD, angina, MI, stroke; a missing questionnaire item counts as "no"
+    cvd_cols = [c for c in ['MCQ160B', 'MCQ160C', 'MCQ160D', 'MCQ160E', 'MCQ160F'] if c in df.columns]
+    df['cvd_history'] = (df[cvd_cols].to_numpy() == 1).any(axis=1).astype(float)
     
     # Cancer
-    cancer = df.get('MCQ220', pd.Series([2] * len(df), index=df.index))
+    cancer = col_or_default(df, 'MCQ220', 2)
     df['cancer_history'] = (cancer == 1).astype(int)
     
     # ==========================================================================
@@ -270,7 +387,7 @@ def build_iri_cohort(df: pd.DataFrame) -> pd.DataFrame:
     # ==========================================================================
     
     # Self-rated health (HUQ010): 1=Excellent, 2=Very good, 3=Good, 4=Fair, 5=Poor
-    df['self_rated_health'] = df.get('HUQ010', pd.Series([np.nan] * len(df), index=df.index))
+    df['self_rated_health'] = col_or_default(df, 'HUQ010')
     df.loc[df['self_rated_health'] > 5, 'self_rated_health'] = np.nan  # 7,9 = refused/don't know
     # Binary: Fair/Poor vs Excellent/Very good/Good
     df['poor_health'] = (df['self_rated_health'] >= 4).astype(float)
@@ -278,12 +395,12 @@ def build_iri_cohort(df: pd.DataFrame) -> pd.DataFrame:
     
     # Mobility limitations (PFQ049): Difficulty walking 1/4 mile
     # 1 = Some difficulty or unable, 2 = No difficulty
-    pfq049 = df.get('PFQ049', pd.Series([np.nan] * len(df), index=df.index))
+    pfq049 = col_or_default(df, 'PFQ049')
     df['difficulty_walking'] = (pfq049 == 1).astype(float)
     df.loc[pfq049.isna() | (pfq049 > 2), 'difficulty_walking'] = np.nan
     
     # Difficulty climbing stairs (PFQ054)
-    pfq054 = df.get('PFQ054', pd.Series([np.nan] * len(df), index=df.index))
+    pfq054 = col_or_default(df, 'PFQ054')
     df['difficulty_stairs'] = (pfq054 == 1).astype(float)
     df.loc[pfq054.isna() | (pfq054 > 2), 'difficulty_stairs'] = np.nan
     
@@ -353,6 +470,7 @@ def main():
         print("\nNo data loaded. Run 01_download_data.py first.")
         return
     
+    # Cycles share CANONICAL_COLUMNS names apart from the survey weights
     combined = pd.concat(all_data, ignore_index=True)
     print(f"\nCombined: {len(combined):,} participants")
     
@@ -381,15 +499,32 @@ def main():
     
     export_vars = [v for v in export_vars if v in combined.columns]
     
+    # Downcast before export: 0/1 indicators to UInt8, measurements to float32
+    int_cols = [
+        'female', 'obesity', 'hypertension', 'diabetes', 'current_smoker',
+        'ckd', 'cvd_history', 'cancer_history', 'eligible',
+    ]
+    float_cols = [
+        'hscrp', 'albumin', 'alm_kg', 'almi',
+        'z_crp_inv', 'z_albumin', 'z_almi', 'iri',
+        'bmi', 'height_m', 'mean_sbp', 'mean_dbp', 'hba1c', 'egfr',
+    ]
+    int_cols = [c for c in int_cols if c in combined.columns]
+    float_cols = [c for c in float_cols if c in combined.columns]
+    combined[int_cols] = combined[int_cols].astype('UInt8')
+    combined[float_cols] = combined[float_cols].astype('float32')
+    
     DATA_PROCESSED.mkdir(parents=True, exist_ok=True)
     
     output_path = DATA_PROCESSED / "iri_cohort.parquet"
-    combined[export_vars].to_parquet(output_path)
+    combined[export_vars].to_parquet(output_path, compression='zstd', use_dictionary=True)
     print(f"\nSaved: {output_path}")
     
-    csv_path = DATA_PROCESSED / "iri_cohort.csv"
-    combined[export_vars].to_csv(csv_path, index=False)
-    print(f"Saved: {csv_path}")
+    # CSV copy is opt-in; 03_link_mortality.py reads the Parquet file
+    if '--csv' in sys.argv:
+        csv_path = DATA_PROCESSED / "iri_cohort.csv"
+        combined[export_vars].to_csv(csv_path, index=False)
+        print(f"Saved: {csv_path}")
     
     # Summary
     eligible = combined[combined['eligible'] == 1]
@@ -4,16 +4,21 @@ Processes NHANES 2011-2014 and 2017-2020 data for the Inflammatory Resilience In
 
 IRI = (-z_hsCRP) + z_albumin + z_grip_strength
 Higher IRI = greater inflammatory resilience
+
+Usage: python 02_harmonize_iri.py [--csv]   (--csv also writes iri_cohort_harmonized.csv)
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 import warnings
 
-warnings.filterwarnings('ignore')
-
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_RAW = PROJECT_ROOT / "data" / "raw"
@@ -155,26 +160,95 @@ MCQ_VARS = {
     "cancer_told": "MCQ220",     # Ever told you had cancer
 }
 
+# Bit order of flags_bitmask (e.g. eligible rows: flags_bitmask & 1)
+FLAG_BITS = [
+    'eligible', 'primary_analysis', 'has_iri_components', 'pregnant',
+    'flag_crp_high', 'flag_crp_very_high', 'flag_albumin_low',
+    'flag_grip_low_p10', 'flag_severe_ckd', 'flag_cancer',
+]
+
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+def downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast float64 columns to float32 (labs, ages, questionnaire codes).
+    
+    SEQN becomes int32 so the per-cycle join runs on an integer key.
+    Survey weights stay float64. Codes stay floating point rather than
+    nullable Int8 so missing answers keep NaN comparison semantics in the
+    define_* functions.
+    """
+    cols = [c for c in df.select_dtypes('float64').columns
+            if c != 'SEQN' and not c.startswith('WT')]
+    if cols:
+        df[cols] = df[cols].astype(np.float32)
+    if 'SEQN' in df.columns:
+        df['SEQN'] = df['SEQN'].astype(np.int32)
+    return df
+
+
+def write_cache(df: pd.DataFrame, cache_path: Path) -> None:
+    """
+    Write a Parquet cache atomically (temp file, then rename), so an
+    interrupted run never leaves a truncated cache that looks up to date.
+    A failed write only loses the cache, not the parsed data.
+    """
+    tmp_path = cache_path.with_suffix(cache_path.suffix + '.tmp')
+    try:
+        df.to_parquet(tmp_path, compression='zstd', compression_level=3)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"  Warning: Could not cache {cache_path.name}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
 def load_xpt(filepath: Path) -> pd.DataFrame:
-    """Load XPT file into pandas DataFrame."""
+    """
+    Load XPT file into pandas DataFrame, with float64 columns downcast.
+    
+    The downcast frame is cached as a Parquet sidecar (<file>.sas.parquet)
+    and reused while newer than the XPT. The suffix differs from the
+    02_build_cohort.py cache because that script parses with pyreadstat,
+    whose dtypes and missing-value handling differ from pd.read_sas.
+    """
+    cache_path = filepath.with_suffix('.sas.parquet')
+    try:
+        cache_fresh = cache_path.stat().st_mtime >= filepath.stat().st_mtime
+    except OSError:
+        cache_fresh = False
+    if cache_fresh:
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            # An unreadable cache is discarded and the XPT parsed afresh
+            print(f"  Warning: Could not read cache {cache_path.name}: {e}")
+            cache_path.unlink(missing_ok=True)
     try:
-        return pd.read_sas(filepath, format='xport', encoding='latin1')
+        with warnings.catch_warnings():
+            # read_sas inserts columns one at a time, which trips the
+            # fragmented-DataFrame PerformanceWarning on wide files
+            warnings.simplefilter('ignore', category=pd.errors.PerformanceWarning)
+            df = downcast_numeric(pd.read_sas(filepath, format='xport', encoding='latin1'))
     except Exception as e:
         print(f"  Warning: Could not load {filepath.name}: {e}")
         return pd.DataFrame()
+    write_cache(df, cache_path)
+    return df
 
 
-def find_file(cycle_dir: Path, pattern: str) -> Optional[Path]:
-    """Find a file matching pattern (case-insensitive)."""
-    matches = list(cycle_dir.glob(f"*{pattern}*")) + list(cycle_dir.glob(f"*{pattern.lower()}*"))
-    if matches:
-        return matches[0]
-    return None
+def scan_xpt_files(cycle_dir: Path) -> dict:
+    """Scan a cycle directory once; map lower-cased XPT filenames to paths."""
+    return {p.name.lower(): p for p in cycle_dir.iterdir()
+            if p.is_file() and p.suffix.lower() == '.xpt'}
+
+
+def find_file(xpt_files: dict, pattern: str) -> Optional[Path]:
+    """Find an XPT file whose name contains pattern (case-insensitive)."""
+    pattern = pattern.lower()
+    return next((path for name, path in xpt_files.items() if pattern in name), None)
 
 
 def compute_max_grip_strength(df: pd.DataFrame) -> pd.Series:
@@ -192,7 +266,7 @@ def compute_max_grip_strength(df: pd.DataFrame) -> pd.Series:
     
     if not available_cols:
         print("  Warning: No grip strength columns found")
-        return pd.Series([np.nan] * len(df), index=df.index)
+        return pd.Series(np.nan, index=df.index)
     
     # Compute max across all available trials
     grip_values = df[available_cols].copy()
@@ -204,6 +278,10 @@ def compute_max_grip_strength(df: pd.DataFrame) -> pd.Series:
     return grip_values.max(axis=1)
 
 
+# 0.9938 ** age evaluated as exp(age * log(0.9938))
+LOG_EGFR_AGE_BASE = np.log(0.9938)
+
+
 def compute_egfr_ckdepi_2021(creatinine: pd.Series, age: pd.Series, sex: pd.Series) -> pd.Series:
     """
     Compute eGFR using CKD-EPI 2021 race-free equation.
@@ -214,32 +292,24 @@ def compute_egfr_ckdepi_2021(creatinine: pd.Series, age: pd.Series, sex: pd.Seri
     - κ = 0.7 (female) or 0.9 (male)
     - α = -0.241 (female) or -0.302 (male)
     """
-    # Initialize result
-    egfr = pd.Series([np.nan] * len(creatinine), index=creatinine.index)
-    
-    # Female (sex == 2)
-    female_mask = sex == 2
-    kappa_f = 0.7
-    alpha_f = -0.241
+    sex = sex.to_numpy()
+    female = sex == 2
     
-    scr_kappa_f = creatinine[female_mask] / kappa_f
-    min_term_f = np.minimum(scr_kappa_f, 1) ** alpha_f
-    max_term_f = np.maximum(scr_kappa_f, 1) ** (-1.200)
-    age_term_f = 0.9938 ** age[female_mask]
-    egfr.loc[female_mask] = 142 * min_term_f * max_term_f * age_term_f * 1.012
+    kappa = np.where(female, 0.7, 0.9)
+    alpha = np.where(female, -0.241, -0.302)
+    female_mult = np.where(female, 1.012, 1.0)
     
-    # Male (sex == 1)
-    male_mask = sex == 1
-    kappa_m = 0.9
-    alpha_m = -0.302
+    scr_kappa = creatinine.to_numpy(dtype=float) / kappa
+    egfr = (142.0
+            * np.minimum(scr_kappa, 1.0) ** alpha
+            * np.maximum(scr_kappa, 1.0) ** -1.200
+            * np.exp(LOG_EGFR_AGE_BASE * age.to_numpy(dtype=float))
+            * female_mult)
     
-    scr_kappa_m = creatinine[male_mask] / kappa_m
-    min_term_m = np.minimum(scr_kappa_m, 1) ** alpha_m
-    max_term_m = np.maximum(scr_kappa_m, 1) ** (-1.200)
-    age_term_m = 0.9938 ** age[male_mask]
-    egfr.loc[male_mask] = 142 * min_term_m * max_term_m * age_term_m
+    # Sex codes other than 1/2 have no defined equation
+    egfr[(sex != 1) & ~female] = np.nan
     
-    return egfr
+    return pd.Series(egfr, index=creatinine.index)
 
 
 def compute_ldl_friedewald(tchol: pd.Series, hdl: pd.Series, trigly: pd.Series) -> pd.Series:
@@ -252,92 +322,90 @@ def compute_ldl_friedewald(tchol: pd.Series, hdl: pd.Series, trigly: pd.Series)
     return ldl
 
 
-def compute_mean_bp(df: pd.DataFrame, cycle: str) -> tuple:
-    """Compute mean SBP and DBP from available readings."""
-    if "2017" in cycle:
-        sbp_cols = [c for c in ['BPXOSY1', 'BPXOSY2', 'BPXOSY3'] if c in df.columns]
-        dbp_cols = [c for c in ['BPXODI1', 'BPXODI2', 'BPXODI3'] if c in df.columns]
-    else:
-        sbp_cols = [c for c in ['BPXSY1', 'BPXSY2', 'BPXSY3', 'BPXSY4'] if c in df.columns]
-        dbp_cols = [c for c in ['BPXDI1', 'BPXDI2', 'BPXDI3', 'BPXDI4'] if c in df.columns]
-    
-    mean_sbp = df[sbp_cols].mean(axis=1) if sbp_cols else pd.Series([np.nan] * len(df), index=df.index)
-    mean_dbp = df[dbp_cols].mean(axis=1) if dbp_cols else pd.Series([np.nan] * len(df), index=df.index)
-    
-    return mean_sbp, mean_dbp
+def col_or_nan(df: pd.DataFrame, name: str, default=np.nan, dtype=np.float32) -> np.ndarray:
+    """Return column `name` as an array, or a constant `default` array if it is absent."""
+    if name in df.columns:
+        return df[name].to_numpy(dtype=dtype)
+    return np.full(len(df), default, dtype=dtype)
+
+
+def indicator_with_missing(positive: np.ndarray, *inputs: np.ndarray) -> np.ndarray:
+    """
+    1.0 where any criterion is met, NaN where every input is missing, else 0.0.
+    """
+    all_missing = np.logical_and.reduce([np.isnan(a) for a in inputs])
+    return np.where(positive, 1.0, np.where(all_missing, np.nan, 0.0))
 
 
 def define_hypertension(df: pd.DataFrame) -> pd.Series:
     """
     Define hypertension: SBP >= 130 OR DBP >= 80 OR on BP medication.
     """
-    sbp = df.get('mean_sbp', pd.Series([np.nan] * len(df)))
-    dbp = df.get('mean_dbp', pd.Series([np.nan] * len(df)))
-    bp_med = df.get('BPQ040A', pd.Series([np.nan] * len(df)))
+    sbp = col_or_nan(df, 'mean_sbp')
+    dbp = col_or_nan(df, 'mean_dbp')
+    bp_med = col_or_nan(df, 'BPQ040A')
     
-    htn = ((sbp >= 130) | (dbp >= 80) | (bp_med == 1)).astype(float)
-    htn[htn == 0] = np.where(
-        sbp.isna() & dbp.isna() & bp_med.isna(),
-        np.nan,
-        0
-    )[htn == 0]
+    htn = indicator_with_missing((sbp >= 130) | (dbp >= 80) | (bp_med == 1),
+                                 sbp, dbp, bp_med)
     
-    return htn
+    return pd.Series(htn, index=df.index)
 
 
 def define_diabetes(df: pd.DataFrame) -> pd.Series:
     """
     Define diabetes: HbA1c >= 6.5% OR FPG >= 126 OR told by doctor OR on meds.
     """
-    hba1c = df.get('LBXGH', pd.Series([np.nan] * len(df)))
-    glucose = df.get('LBXGLU', pd.Series([np.nan] * len(df)))
-    told = df.get('DIQ010', pd.Series([np.nan] * len(df)))
-    insulin = df.get('DIQ050', pd.Series([np.nan] * len(df)))
-    oral_med = df.get('DIQ070', pd.Series([np.nan] * len(df)))
+    hba1c = col_or_nan(df, 'LBXGH')
+    glucose = col_or_nan(df, 'LBXGLU')
+    told = col_or_nan(df, 'DIQ010')
+    insulin = col_or_nan(df, 'DIQ050')
+    oral_med = col_or_nan(df, 'DIQ070')
     
-    dm = ((hba1c >= 6.5) | 
-          (glucose >= 126) | 
-          (told == 1) |
-          (insulin == 1) | 
-          (oral_med == 1)).astype(float)
+    dm = indicator_with_missing((hba1c >= 6.5) | 
+                                (glucose >= 126) | 
+                                (told == 1) |
+                                (insulin == 1) | 
+                                (oral_med == 1),
+                                hba1c, glucose, told, insulin, oral_med)
     
-    return dm
+    return pd.Series(dm, index=df.index)
+
+
+# Smoking status looked up by packed (SMQ020, SMQ040) codes: key = SMQ020 * 16 + SMQ040,
+# missing -> 0. Unlisted combinations (refused/don't know) stay NaN.
+SMOKING_STATUS_LUT = np.full(256, np.nan, dtype=np.float32)
+SMOKING_STATUS_LUT[2 * 16:3 * 16] = 0           # Never: didn't smoke 100+ cigarettes
+SMOKING_STATUS_LUT[1 * 16 + 1] = 2              # Current: every day
+SMOKING_STATUS_LUT[1 * 16 + 2] = 2              # Current: some days
+SMOKING_STATUS_LUT[1 * 16 + 3] = 1              # Former: not at all now
 
 
 def define_smoking_status(df: pd.DataFrame) -> pd.Series:
     """
     Define smoking status: 0=Never, 1=Former, 2=Current.
     """
-    smoke_100 = df.get('SMQ020', pd.Series([np.nan] * len(df)))
-    smoke_now = df.get('SMQ040', pd.Series([np.nan] * len(df)))
+    smoke_100 = np.nan_to_num(col_or_nan(df, 'SMQ020')).clip(0, 15).astype(np.uint8)
+    smoke_now = np.nan_to_num(col_or_nan(df, 'SMQ040')).clip(0, 15).astype(np.uint8)
     
-    status = pd.Series([np.nan] * len(df), index=df.index)
+    status = SMOKING_STATUS_LUT[smoke_100 * 16 + smoke_now]
     
-    # Never: didn't smoke 100+ cigarettes (SMQ020 = 2)
-    status[smoke_100 == 2] = 0
-    
-    # Current: smoked 100+ and currently smokes (SMQ040 = 1 or 2)
-    status[(smoke_100 == 1) & smoke_now.isin([1, 2])] = 2
-    
-    # Former: smoked 100+ but not at all now (SMQ040 = 3)
-    status[(smoke_100 == 1) & (smoke_now == 3)] = 1
-    
-    return status
+    return pd.Series(status, index=df.index)
 
 
 def define_cvd_history(df: pd.DataFrame) -> pd.Series:
     """
     Define prevalent CVD: CHF, CHD, angina, MI, or stroke.
     """
-    chf = df.get('MCQ160B', pd.Series([2] * len(df)))
-    chd = df.get('MCQ160C', pd.Series([2] * len(df)))
-    angina = df.get('MCQ160D', pd.Series([2] * len(df)))
-    mi = df.get('MCQ160E', pd.Series([2] * len(df)))
-    stroke = df.get('MCQ160F', pd.Series([2] * len(df)))
+    chf = col_or_nan(df, 'MCQ160B', default=2)
+    chd = col_or_nan(df, 'MCQ160C', default=2)
+    angina = col_or_nan(df, 'MCQ160D', default=2)
+    mi = col_or_nan(df, 'MCQ160E', default=2)
+    stroke = col_or_nan(df, 'MCQ160F', default=2)
     
-    cvd = ((chf == 1) | (chd == 1) | (angina == 1) | (mi == 1) | (stroke == 1)).astype(float)
+    cvd = indicator_with_missing((chf == 1) | (chd == 1) | (angina == 1) | (mi == 1) | (stroke == 1),
+                                 chf, chd, angina, mi, stroke)
     
-    return cvd
+    return pd.Series(cvd, index=df.index)
 
 
 def compute_physical_activity_met_min(df: pd.DataFrame) -> pd.Series:
@@ -345,48 +413,21 @@ def compute_physical_activity_met_min(df: pd.DataFrame) -> pd.Series:
     Compute total MET-minutes per week from GPAQ data.
     Vigorous = 8 METs, Moderate = 4 METs
     """
-    met_min = pd.Series([0.0] * len(df), index=df.index)
-    
-    # Vigorous work
-    vig_work = df.get('PAQ605', pd.Series([2] * len(df)))
-    vig_work_days = df.get('PAQ610', pd.Series([0] * len(df)))
-    vig_work_min = df.get('PAD615', pd.Series([0] * len(df)))
-    
-    vig_work_met = np.where(vig_work == 1, 
-                            8 * vig_work_days.fillna(0) * vig_work_min.fillna(0), 
-                            0)
-    
-    # Moderate work
-    mod_work = df.get('PAQ620', pd.Series([2] * len(df)))
-    mod_work_days = df.get('PAQ625', pd.Series([0] * len(df)))
-    mod_work_min = df.get('PAD630', pd.Series([0] * len(df)))
-    
-    mod_work_met = np.where(mod_work == 1,
-                            4 * mod_work_days.fillna(0) * mod_work_min.fillna(0),
-                            0)
-    
-    # Vigorous recreation
-    vig_rec = df.get('PAQ650', pd.Series([2] * len(df)))
-    vig_rec_days = df.get('PAQ655', pd.Series([0] * len(df)))
-    vig_rec_min = df.get('PAD660', pd.Series([0] * len(df)))
-    
-    vig_rec_met = np.where(vig_rec == 1,
-                           8 * vig_rec_days.fillna(0) * vig_rec_min.fillna(0),
-                           0)
-    
-    # Moderate recreation
-    mod_rec = df.get('PAQ665', pd.Series([2] * len(df)))
-    mod_rec_days = df.get('PAQ670', pd.Series([0] * len(df)))
-    mod_rec_min = df.get('PAD675', pd.Series([0] * len(df)))
-    
-    mod_rec_met = np.where(mod_rec == 1,
-                           4 * mod_rec_days.fillna(0) * mod_rec_min.fillna(0),
-                           0)
-    
-    met_min = vig_work_met + mod_work_met + vig_rec_met + mod_rec_met
+    # (participates, days/week, minutes/day) for each domain; missing -> 0
+    cols = ['PAQ605', 'PAQ610', 'PAD615',   # Vigorous work
+            'PAQ620', 'PAQ625', 'PAD630',   # Moderate work
+            'PAQ650', 'PAQ655', 'PAD660',   # Vigorous recreation
+            'PAQ665', 'PAQ670', 'PAD675']   # Moderate recreation
+    w = np.stack([col_or_nan(df, c, default=0) for c in cols])
+    np.nan_to_num(w, copy=False)
+    
+    met_min = ((w[0] == 1) * 8 * w[1] * w[2] +
+               (w[3] == 1) * 4 * w[4] * w[5] +
+               (w[6] == 1) * 8 * w[7] * w[8] +
+               (w[9] == 1) * 4 * w[10] * w[11])
     
     # Cap at reasonable maximum (10080 = 24h * 7days)
-    met_min = np.minimum(met_min, 10080)
+    np.minimum(met_min, 10080, out=met_min)
     
     return pd.Series(met_min, index=df.index)
 
@@ -405,12 +446,13 @@ def process_cycle(cycle: str) -> pd.DataFrame:
     if not cycle_dir.exists():
         print(f"  Cycle directory not found: {cycle_dir}")
         return pd.DataFrame()
+    xpt_files = scan_xpt_files(cycle_dir)
     
     # Determine if pre-pandemic
     is_prepandemic = "2017" in cycle
     
     # Load demographics
-    demo_file = find_file(cycle_dir, "DEMO")
+    demo_file = find_file(xpt_files, "DEMO")
     if not demo_file:
         print("  No DEMO file found")
         return pd.DataFrame()
@@ -437,21 +479,33 @@ def process_cycle(cycle: str) -> pd.DataFrame:
         ("MCQ", "Medical conditions"),
     ]
     
+    # Index each component on SEQN and join them onto DEMO in one pass.
+    # Colliding columns are renamed up front, matching what sequential
+    # merge(suffixes=('', f'_{pattern}')) calls would have produced.
+    seen = set(df.columns)
+    components = []
     for pattern, description in file_patterns:
-        file_path = find_file(cycle_dir, pattern)
+        file_path = find_file(xpt_files, pattern)
         if file_path:
             comp_df = load_xpt(file_path)
             if 'SEQN' in comp_df.columns and len(comp_df) > 0:
-                df = df.merge(comp_df, on='SEQN', how='left', suffixes=('', f'_{pattern}'))
-                print(f"  Merged {description}: {len(comp_df):,} records")
+                n_records = len(comp_df)
+                comp_df = comp_df.drop_duplicates('SEQN').set_index('SEQN')
+                comp_df = comp_df.rename(columns={c: f'{c}_{pattern}' for c in comp_df.columns if c in seen})
+                seen.update(comp_df.columns)
+                components.append(comp_df)
+                print(f"  Merged {description}: {n_records:,} records")
         else:
             print(f"  Warning: {description} file not found")
     
+    if components:
+        df = df.set_index('SEQN').join(components, how='left').reset_index()
+    
     # Add cycle identifier
     df['cycle'] = cycle
     df['is_prepandemic'] = is_prepandemic
     
-    return df
+    return df.reset_index(drop=True)
 
 
 def construct_iri(df: pd.DataFrame) -> pd.DataFrame:
@@ -465,44 +519,56 @@ def construct_iri(df: pd.DataFrame) -> pd.DataFrame:
     print("="*60)
     
     # Extract core IRI components
-    df['hscrp'] = df.get('LBXHSCRP', pd.Series([np.nan] * len(df)))
-    df['albumin'] = df.get('LBXSAL', pd.Series([np.nan] * len(df)))
+    df['hscrp'] = col_or_nan(df, 'LBXHSCRP')
+    df['albumin'] = col_or_nan(df, 'LBXSAL')
     df['grip_max'] = compute_max_grip_strength(df)
     
-    # Log-transform hs-CRP
-    df['log_hscrp'] = np.log(df['hscrp'].replace(0, np.nan))
+    # Work on raw arrays so each statistic is one NumPy pass
+    # (std uses ddof=1 to match pandas)
+    hscrp = df['hscrp'].to_numpy(dtype=float)
+    albumin = df['albumin'].to_numpy(dtype=float)
+    grip_max = df['grip_max'].to_numpy(dtype=float)
+    
+    # Log-transform hs-CRP (non-positive values are treated as missing)
+    log_hscrp = np.log(np.where(hscrp > 0, hscrp, np.nan))
     
     # Compute z-scores
     # hs-CRP: overall z-score (log-transformed)
-    df['z_log_hscrp'] = (df['log_hscrp'] - df['log_hscrp'].mean()) / df['log_hscrp'].std()
+    z_log_hscrp = (log_hscrp - np.nanmean(log_hscrp)) / np.nanstd(log_hscrp, ddof=1)
     
     # Albumin: overall z-score
-    df['z_albumin'] = (df['albumin'] - df['albumin'].mean()) / df['albumin'].std()
+    z_albumin = (albumin - np.nanmean(albumin)) / np.nanstd(albumin, ddof=1)
+    
+    df['log_hscrp'] = log_hscrp
+    df['z_log_hscrp'] = z_log_hscrp
+    df['z_albumin'] = z_albumin
     
     # Grip strength: sex-specific z-scores
-    df['z_grip'] = np.nan
-    for sex in [1, 2]:  # 1=Male, 2=Female
-        mask = df['RIAGENDR'] == sex
-        if mask.sum() > 0:
-            grip_mean = df.loc[mask, 'grip_max'].mean()
-            grip_std = df.loc[mask, 'grip_max'].std()
-            df.loc[mask, 'z_grip'] = (df.loc[mask, 'grip_max'] - grip_mean) / grip_std
+    # (1=Male, 2=Female; per-sex mean/std broadcast back to every row)
+    grip_by_sex = df.groupby('RIAGENDR', sort=False)['grip_max']
+    df['z_grip'] = ((df['grip_max'] - grip_by_sex.transform('mean'))
+                    / grip_by_sex.transform('std'))
     
     # Construct IRI
     # IRI = (-z_hsCRP) + z_albumin + z_grip
-    df['iri'] = (-df['z_log_hscrp']) + df['z_albumin'] + df['z_grip']
+    df['iri'] = z_albumin - z_log_hscrp + df['z_grip'].to_numpy(dtype=float)
     
     print(f"  IRI computed for {df['iri'].notna().sum():,} participants")
     print(f"  IRI mean: {df['iri'].mean():.3f}, std: {df['iri'].std():.3f}")
     
-    # Create IRI quartiles
-    df['iri_quartile'] = pd.qcut(df['iri'], q=4, labels=['Q1 (lowest)', 'Q2', 'Q3', 'Q4 (highest)'])
+    # Create IRI quartiles (right-closed bins, as pd.qcut; missing IRI -> code -1)
+    iri = df['iri'].to_numpy(dtype=float)
+    has_iri = ~np.isnan(iri)
+    edges = np.quantile(iri[has_iri], [0.25, 0.5, 0.75])
+    codes = np.where(has_iri, np.digitize(iri, edges, right=True), -1).astype(np.int8)
+    df['iri_quartile'] = pd.Categorical.from_codes(
+        codes, categories=['Q1 (lowest)', 'Q2', 'Q3', 'Q4 (highest)'], ordered=True)
     
     # Create sensitivity flags
-    df['flag_crp_high'] = (df['hscrp'] > 10).astype(int)
-    df['flag_crp_very_high'] = (df['hscrp'] > 20).astype(int)
-    df['flag_albumin_low'] = (df['albumin'] < 3.5).astype(int)
-    df['flag_grip_low_p10'] = (df['grip_max'] < df['grip_max'].quantile(0.10)).astype(int)
+    df['flag_crp_high'] = (hscrp > 10).astype(np.uint8)
+    df['flag_crp_very_high'] = (hscrp > 20).astype(np.uint8)
+    df['flag_albumin_low'] = (albumin < 3.5).astype(np.uint8)
+    df['flag_grip_low_p10'] = (grip_max < np.nanquantile(grip_max, 0.10)).astype(np.uint8)
     
     return df
 
@@ -516,7 +582,7 @@ def create_derived_variables(df: pd.DataFrame) -> pd.DataFrame:
     # Demographics
     df['age'] = df['RIDAGEYR']
     df['sex'] = df['RIAGENDR']  # 1=Male, 2=Female
-    df['female'] = (df['sex'] == 2).astype(int)
+    df['female'] = (df['sex'] == 2).astype(np.uint8)
     
     # Race/ethnicity (RIDRETH3 for 2011+)
     # 1=Mexican American, 2=Other Hispanic, 3=NH White, 4=NH Black, 6=NH Asian, 7=Other/Multi
@@ -525,18 +591,18 @@ def create_derived_variables(df: pd.DataFrame) -> pd.DataFrame:
     # Education (DMDEDUC2 for adults 20+)
     # 1=Less than 9th grade, 2=9-11th grade, 3=HS grad/GED, 4=Some college, 5=College grad+
     df['education'] = df['DMDEDUC2']
-    df['college_grad'] = (df['education'] >= 5).astype(int)
+    df['college_grad'] = (df['education'] >= 5).astype(np.uint8)
     
     # Poverty income ratio
     df['pir'] = df['INDFMPIR']
-    df['poverty'] = (df['pir'] < 1.0).astype(int)
+    df['poverty'] = (df['pir'] < 1.0).astype(np.uint8)
     
     # BMI categories
     df['bmi'] = df['BMXBMI']
     df['bmi_cat'] = pd.cut(df['bmi'], 
                            bins=[0, 18.5, 25, 30, 100],
                            labels=['Underweight', 'Normal', 'Overweight', 'Obese'])
-    df['obesity'] = (df['bmi'] >= 30).astype(int)
+    df['obesity'] = (df['bmi'] >= 30).astype(np.uint8)
     
     # eGFR (CKD-EPI 2021)
     df['creatinine'] = df['LBXSCR']
@@ -544,20 +610,20 @@ def create_derived_variables(df: pd.DataFrame) -> pd.DataFrame:
     df['ckd_stage'] = pd.cut(df['egfr'],
                              bins=[0, 15, 30, 45, 60, 90, 200],
                              labels=['G5', 'G4', 'G3b', 'G3a', 'G2', 'G1'])
-    df['egfr_lt60'] = (df['egfr'] < 60).astype(int)
-    df['flag_severe_ckd'] = (df['egfr'] < 30).astype(int)
+    df['egfr_lt60'] = (df['egfr'] < 60).astype(np.uint8)
+    df['flag_severe_ckd'] = (df['egfr'] < 30).astype(np.uint8)
     
-    # Blood pressure
-    df['mean_sbp'], df['mean_dbp'] = zip(*df.groupby('cycle').apply(
-        lambda g: pd.DataFrame({'sbp': compute_mean_bp(g, g.name)[0], 
-                                 'dbp': compute_mean_bp(g, g.name)[1]}).values.T.tolist()
-    ).explode().apply(lambda x: (x[0], x[1]) if isinstance(x, list) else (np.nan, np.nan)))
-    
-    # Simpler approach for BP
+    # Blood pressure: mean of available readings (BPXSY* or oscillometric BPXOSY*)
     sbp_cols = [c for c in df.columns if 'BPXSY' in c or 'BPXOSY' in c]
     dbp_cols = [c for c in df.columns if 'BPXDI' in c or 'BPXODI' in c]
-    df['mean_sbp'] = df[sbp_cols].mean(axis=1) if sbp_cols else np.nan
-    df['mean_dbp'] = df[dbp_cols].mean(axis=1) if dbp_cols else np.nan
+    # Row-major copies so each participant's readings are adjacent in memory
+    sbp = np.ascontiguousarray(df[sbp_cols].to_numpy(dtype=np.float32))
+    dbp = np.ascontiguousarray(df[dbp_cols].to_numpy(dtype=np.float32))
+    with warnings.catch_warnings():
+        # Participants with no BP readings legitimately get NaN
+        warnings.filterwarnings('ignore', 'Mean of empty slice', RuntimeWarning)
+        df['mean_sbp'] = np.nanmean(sbp, axis=1) if sbp_cols else np.nan
+        df['mean_dbp'] = np.nanmean(dbp, axis=1) if dbp_cols else np.nan
     
     # Hypertension
     df['hypertension'] = define_hypertension(df)
@@ -568,28 +634,28 @@ def create_derived_variables(df: pd.DataFrame) -> pd.DataFrame:
     
     # Lipids
     df['tchol'] = df['LBXTC']
-    df['hdl'] = df.get('LBDHDD', df.get('LBXHDD', pd.Series([np.nan] * len(df))))
+    df['hdl'] = col_or_nan(df, 'LBDHDD' if 'LBDHDD' in df.columns else 'LBXHDD')
     df['trigly'] = df['LBXTR']
     df['ldl'] = compute_ldl_friedewald(df['tchol'], df['hdl'], df['trigly'])
     df['dyslipidemia'] = ((df['tchol'] >= 200) | (df['ldl'] >= 130) | 
-                          (df['hdl'] < 40) | (df['trigly'] >= 150)).astype(int)
+                          (df['hdl'] < 40) | (df['trigly'] >= 150)).astype(np.uint8)
     
     # Smoking
     df['smoking_status'] = define_smoking_status(df)
-    df['current_smoker'] = (df['smoking_status'] == 2).astype(int)
+    df['current_smoker'] = (df['smoking_status'] == 2).astype(np.uint8)
     
     # Physical activity
     df['met_min_week'] = compute_physical_activity_met_min(df)
-    df['meets_pa_guidelines'] = (df['met_min_week'] >= 600).astype(int)  # 150 min moderate or 75 min vigorous
+    df['meets_pa_guidelines'] = (df['met_min_week'] >= 600).astype(np.uint8)  # 150 min moderate or 75 min vigorous
     
     # CVD history
     df['cvd_history'] = define_cvd_history(df)
-    df['chf_history'] = (df.get('MCQ160B', pd.Series([2] * len(df))) == 1).astype(int)
-    df['cancer_history'] = (df.get('MCQ220', pd.Series([2] * len(df))) == 1).astype(int)
+    df['chf_history'] = (col_or_nan(df, 'MCQ160B', default=2) == 1).astype(np.uint8)
+    df['cancer_history'] = (col_or_nan(df, 'MCQ220', default=2) == 1).astype(np.uint8)
     df['flag_cancer'] = df['cancer_history']
     
     # Pregnancy exclusion flag
-    df['pregnant'] = (df.get('RIDEXPRG', pd.Series([2] * len(df))) == 1).astype(int)
+    df['pregnant'] = (col_or_nan(df, 'RIDEXPRG', default=2) == 1).astype(np.uint8)
     
     print(f"  Created derived variables for {len(df):,} participants")
     
@@ -617,7 +683,7 @@ def apply_eligibility_criteria(df: pd.DataFrame) -> pd.DataFrame:
     n_start = len(df)
     
     # Create eligibility flag (not excluding yet)
-    df['eligible'] = 1
+    df['eligible'] = np.ones(len(df), dtype=np.uint8)
     
     # Age >= 18
     df.loc[df['age'] < 18, 'eligible'] = 0
@@ -633,24 +699,30 @@ def apply_eligibility_criteria(df: pd.DataFrame) -> pd.DataFrame:
     has_crp = df['hscrp'].notna()
     has_alb = df['albumin'].notna()
     has_grip = df['grip_max'].notna()
-    df['has_iri_components'] = (has_crp & has_alb & has_grip).astype(int)
+    df['has_iri_components'] = (has_crp & has_alb & has_grip).astype(np.uint8)
     df.loc[df['has_iri_components'] == 0, 'eligible'] = 0
     
     n_iri = df['has_iri_components'].sum()
     print(f"  Has all IRI components: {n_iri:,}")
     
     # Has mortality linkage eligibility (non-missing SEQN is sufficient for public data)
-    df['has_mortality_eligible'] = 1  # Will update after merging mortality
+    df['has_mortality_eligible'] = np.ones(len(df), dtype=np.uint8)  # Will update after merging mortality
     
     # Final eligible count
     n_eligible = df['eligible'].sum()
     print(f"\n  Total eligible: {n_eligible:,} ({100*n_eligible/n_start:.1f}%)")
     
     # Create primary analysis flag (eligible AND hs-CRP <= 10)
-    df['primary_analysis'] = ((df['eligible'] == 1) & (df['hscrp'] <= 10)).astype(int)
+    df['primary_analysis'] = ((df['eligible'] == 1) & (df['hscrp'] <= 10)).astype(np.uint8)
     n_primary = df['primary_analysis'].sum()
     print(f"  Primary analysis (CRP <= 10): {n_primary:,}")
     
+    # Pack the 0/1 flags into one column; bit i is FLAG_BITS[i]
+    bitmask = np.zeros(len(df), dtype=np.uint16)
+    for bit, flag in enumerate(FLAG_BITS):
+        bitmask |= df[flag].to_numpy(dtype=np.uint16) << bit
+    df['flags_bitmask'] = bitmask
+    
     return df
 
 
@@ -661,20 +733,19 @@ def main():
     print("="*60)
     
     # Process each cycle
+    # Cycles are independent, so load and merge them in parallel
     cycles = ["2011-2012", "2013-2014", "2017-2020"]
-    all_data = []
-    
-    for cycle in cycles:
-        df = process_cycle(cycle)
-        if len(df) > 0:
-            all_data.append(df)
+    with ProcessPoolExecutor(max_workers=len(cycles)) as executor:
+        all_data = [df for df in executor.map(process_cycle, cycles) if len(df) > 0]
     
     if not all_data:
         print("\nNo data loaded. Run 01_download_data.py first.")
         return
     
-    # Combine cycles
-    combined = pd.concat(all_data, ignore_index=True)
+    # Combine cycles through Arrow: columns missing from a cycle are null-filled
+    # and float32 downcasts survive instead of being upcast column by column
+    tables = [pa.Table.from_pandas(df, preserve_index=False) for df in all_data]
+    combined = pa.concat_tables(tables, promote_options='permissive').to_pandas()
     print(f"\nCombined: {len(combined):,} participants across all cycles")
     
     # Construct IRI
@@ -724,7 +795,7 @@ def main():
         'pregnant',
         'flag_crp_high', 'flag_crp_very_high',
         'flag_albumin_low', 'flag_grip_low_p10',
-        'flag_severe_ckd', 'flag_cancer',
+        'flag_severe_ckd', 'flag_cancer', 'flags_bitmask',
     ]
     
     # Keep only variables that exist
@@ -736,10 +807,12 @@ def main():
     combined[export_vars].to_parquet(output_path)
     print(f"\nSaved: {output_path}")
     
-    # Also save as CSV for R import
-    csv_path = DATA_PROCESSED / "iri_cohort_harmonized.csv"
-    combined[export_vars].to_csv(csv_path, index=False)
-    print(f"Saved: {csv_path}")
+    # CSV is opt-in; R can read the Parquet file with arrow::read_parquet()
+    if '--csv' in sys.argv:
+        csv_path = DATA_PROCESSED / "iri_cohort_harmonized.csv"
+        table = pa.Table.from_pandas(combined[export_vars], preserve_index=False)
+        pacsv.write_csv(table, csv_path)
+        print(f"Saved: {csv_path}")
     
     # Summary statistics
     print("\n" + "="*60)
@@ -7,12 +7,20 @@ Defines outcomes: all-cause, cardiovascular, and heart failure mortality.
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_PROCESSED = PROJECT_ROOT / "data" / "processed"
 DATA_MORTALITY = PROJECT_ROOT / "data" / "mortality"
 
+# Approximate follow-up (years) for participants not in the mortality file
+# 2015-2016 to 2019 = ~3-4 years; 2017-2018 to 2019 = ~1-2 years
+APPROX_FOLLOWUP_YEARS = {'2015-2016': 3.5, '2017-2020': 2.0}
+
 # Mortality file column specifications (fixed-width format)
 # Based on NCHS documentation for public-use linked mortality files
 MORT_COLSPECS = [
@@ -38,24 +46,30 @@ def load_mortality_file(filepath: Path) -> pd.DataFrame:
         print(f"  File not found: {filepath}")
         return pd.DataFrame()
     
-    try:
-        # Read fixed-width file
-        df = pd.read_fwf(filepath, colspecs=MORT_COLSPECS, names=MORT_NAMES, 
-                         dtype=str, na_values=['.', ''])
-        
-        # Extract SEQN from PUBLICID
-        df['SEQN'] = df['publicid'].str.strip().astype(float)
-        
-        # Convert numeric columns
-        for col in ['eligstat', 'mortstat', 'ucod_leading', 'permth_int', 'permth_exm']:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-        
-        print(f"  Loaded {len(df):,} mortality records from {filepath.name}")
-        return df
-        
-    except Exception as e:
-        print(f"  Error loading {filepath}: {e}")
-        return pd.DataFrame()
+    # Fixed-width records: pad lines to a common width (trailing blanks
+    # may be trimmed), then slice every field out of one byte matrix.
+    # A malformed file raises rather than silently yielding no deaths
+    lines = [line for line in filepath.read_bytes().splitlines() if line.strip()]
+    width = max(max(map(len, lines)), MORT_COLSPECS[-1][1])
+    raw = np.frombuffer(b''.join(line.ljust(width) for line in lines),
+                        dtype=np.uint8).reshape(len(lines), width)
+    
+    fields = {}
+    for name, (start, end) in zip(MORT_NAMES, MORT_COLSPECS):
+        fields[name] = np.char.strip(raw[:, start:end].copy().view(f'S{end - start}').ravel())
+    
+    # Extract SEQN from PUBLICID; all remaining fields are numeric codes,
+    # with blank or '.' marking missing (e.g. MORTSTAT for ineligible records)
+    df = pd.DataFrame({'publicid': fields.pop('publicid').astype(str)})
+    df['SEQN'] = df['publicid'].astype(float)
+    for col, values in fields.items():
+        out = np.full(len(values), np.nan)
+        present = (values != b'') & (values != b'.')
+        out[present] = values[present].astype(float)
+        df[col] = out
+    
+    print(f"  Loaded {len(df):,} mortality records from {filepath.name}")
+    return df
 
 
 def define_cause_specific_mortality(df: pd.DataFrame) -> pd.DataFrame:
@@ -103,8 +117,9 @@ def main():
         print("Error: Cohort file not found. Run 02_build_cohort.py first.")
         return
     
-    df = pd.read_parquet(cohort_path)
-    print(f"Loaded IRI cohort: {len(df):,} participants")
+    # The cohort stays an Arrow table through the join and both writes
+    cohort = pq.read_table(cohort_path)
+    print(f"Loaded IRI cohort: {cohort.num_rows:,} participants")
     
     # Load mortality files
     print("\nLoading mortality files...")
@@ -126,11 +141,8 @@ def main():
     if not all_mort:
         print("\nNo mortality data loaded. Creating placeholder mortality variables...")
         # Create placeholder - analysis will need actual mortality data
-        df['mortstat'] = np.nan
-        df['mort_all'] = np.nan
-        df['mort_cv'] = np.nan
-        df['mort_heart'] = np.nan
-        df['followup_years'] = np.nan
+        for col in ['mortstat', 'mort_all', 'mort_cv', 'mort_heart', 'followup_years']:
+            cohort = cohort.append_column(col, pa.nulls(cohort.num_rows, pa.float64()))
     else:
         # Combine mortality data
         combined_mort = pd.concat(all_mort, ignore_index=True)
@@ -139,33 +151,43 @@ def main():
         
         print(f"\nCombined mortality data: {len(combined_mort):,} records")
         
-        # Merge with cohort
+        # Left-join with cohort; Arrow joins do not preserve row order, so
+        # carry the cohort position through and sort back on it
         mort_vars = ['SEQN', 'mortstat', 'permth_exm', 'mort_all', 'mort_cv', 'mort_heart', 'mort_cancer']
-        df = df.merge(combined_mort[mort_vars], on='SEQN', how='left')
+        mort = pa.Table.from_pandas(combined_mort[mort_vars], preserve_index=False)
+        metadata = cohort.schema.metadata
+        cohort = cohort.append_column('_row', pa.array(np.arange(cohort.num_rows)))
+        cohort = (cohort.join(mort, 'SEQN', join_type='left outer')
+                  .sort_by('_row')
+                  .drop_columns(['_row'])
+                  .replace_schema_metadata(metadata))
         
-        # Fill NaN mortality (not linked = assumed alive through follow-up)
-        df['mortstat'] = df['mortstat'].fillna(0).astype(int)
-        df['mort_all'] = df['mort_all'].fillna(0).astype(int)
-        df['mort_cv'] = df['mort_cv'].fillna(0).astype(int)
-        df['mort_heart'] = df['mort_heart'].fillna(0).astype(int)
-        df['mort_cancer'] = df['mort_cancer'].fillna(0).astype(int)
+        # Fill missing mortality (not linked = assumed alive through follow-up)
+        for col in ['mortstat', 'mort_all', 'mort_cv', 'mort_heart', 'mort_cancer']:
+            filled = pc.fill_null(cohort[col], 0).cast(pa.int64())
+            cohort = cohort.set_column(cohort.schema.get_field_index(col), col, filled)
         
         # Calculate follow-up time
-        df['followup_years'] = df['permth_exm'] / 12
+        followup = pc.divide(cohort['permth_exm'], 12.0)
         # For those not in mortality file, use approximate follow-up
-        # 2015-2016 to 2019 = ~3-4 years; 2017-2018 to 2019 = ~1-2 years
-        df.loc[df['followup_years'].isna() & (df['cycle'] == '2015-2016'), 'followup_years'] = 3.5
-        df.loc[df['followup_years'].isna() & (df['cycle'] == '2017-2020'), 'followup_years'] = 2.0
+        for cycle, years in APPROX_FOLLOWUP_YEARS.items():
+            fill = pc.and_(pc.is_null(followup), pc.equal(cohort['cycle'], cycle))
+            followup = pc.if_else(fill, years, followup)
+        cohort = cohort.append_column('followup_years', followup)
     
     # Save linked dataset
     output_path = DATA_PROCESSED / "iri_cohort_mortality.parquet"
-    df.to_parquet(output_path)
+    pq.write_table(cohort, output_path)
     print(f"\nSaved: {output_path}")
     
+    # CSV for the R survival scripts, written by Arrow's C++ writer
     csv_path = DATA_PROCESSED / "iri_cohort_mortality.csv"
-    df.to_csv(csv_path, index=False)
+    pacsv.write_csv(cohort, csv_path)
     print(f"Saved: {csv_path}")
     
+    df = cohort.select(['eligible', 'iri_quartile', 'mort_all', 'mort_cv',
+                        'mort_heart', 'followup_years']).to_pandas()
+    
     # Summary
     eligible = df[df['eligible'] == 1]
     print("\n" + "="*60)